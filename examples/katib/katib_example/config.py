@@ -0,0 +1,29 @@
+"""Configuration of an experiment trial."""
+
+import functools
+from dataclasses import dataclass
+
+import draccus
+
+
+@dataclass(frozen=True)
+class NestedConfig:
+    """Some nested configuration."""
+
+    hyperparameter: float
+
+
+@dataclass(frozen=True)
+class Config:
+    """Training Config for Machine Learning."""
+
+    nested: NestedConfig
+    tensorboard_dir: str
+
+    @functools.cached_property
+    def _repr(self) -> str:
+        # Dumping the config is expensive and it can not change, so only do it once.
+        return draccus.cfgparsing.dump(self)
+
+    def __repr__(self) -> str:
+        return self._repr
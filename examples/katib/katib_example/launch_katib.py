@@ -1,12 +1,15 @@
 """Utilities for Katib trial runners spawned through `launch`."""
 
+import functools
 import os
 from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Self
+from typing import Self, cast
 
+_ENV_KEYS = ("KATIB_BASE_URL", "KATIB_NAMESPACE", "KATIB_TRIAL_NAME")
 
-@dataclass
+
+@dataclass(frozen=True)
 class KatibTrialInfo:
     """Provides structured access to Katib Trial information passed through environment variables."""
 
@@ -17,7 +20,7 @@ class KatibTrialInfo:
     # TODO: Add when https://github.com/kubeflow/katib/issues/2474 is resolved.
     # trial_url: str
 
-    @property
+    @functools.cached_property
     def experiment_url(self) -> str:
         """Returns the Katib Experiment URL."""
         return f"{self.base_url}/katib/experiment/{self.experiment_name}"
@@ -27,29 +30,25 @@ class KatibTrialInfo:
         """Parse Katib Trial information from the provided environment.
 
         Returns `None` when none of the environment variables `KATIB_BASE_URL`,
-        `KATIB_NAMESPACE`, and `KATIB_TRIAL_NAME` are set.
+        `KATIB_NAMESPACE`, and `KATIB_TRIAL_NAME` are set. Empty values are
+        treated as unset.
 
         If any of these environment variables is set, they are all expected to
         be set and have valid values. If not, an error is raised.
         """
-        base_url = env.get("KATIB_BASE_URL")
-        namespace = env.get("KATIB_NAMESPACE")
-        trial_name = env.get("KATIB_TRIAL_NAME")
-        if base_url is None and namespace is None and trial_name is None:
+        # Treat empty values the same as unset ones so presence is decided in a single pass.
+        vals = tuple(env.get(key) or None for key in _ENV_KEYS)
+        missing = [key for key, val in zip(_ENV_KEYS, vals, strict=True) if val is None]
+        if len(missing) == len(_ENV_KEYS):
             return None
-        if base_url is None or namespace is None or trial_name is None:
+        if missing:
             raise KeyError(
                 "expected all environment variables `KATIB_BASE_URL`, `KATIB_NAMESPACE` and `KATIB_TRIAL_NAME`"
-                " to be set when any one of them is set"
+                f" to be set and non-empty when any one of them is, missing: {', '.join(missing)}"
             )
-        if not base_url:
-            raise ValueError("environment variable `KATIB_BASE_URL` may not be empty")
-        if not namespace:
-            raise ValueError("environment variable `KATIB_NAMESPACE` may not be empty")
-        if not trial_name:
-            raise ValueError("environment variable `KATIB_TRIAL_NAME` may not be empty")
-        experiment_name = trial_name.rsplit("-", 1)[0]
-        if not experiment_name:
+        base_url, namespace, trial_name = cast(tuple[str, str, str], vals)
+        experiment_name, sep, _ = trial_name.rpartition("-")
+        if not sep or not experiment_name:
             raise ValueError("environment variable `KATIB_TRIAL_NAME` must contain experiment name")
 
         return cls(
@@ -1,46 +1,64 @@
 """Entrypoint to run an experiment trial."""
 
+import functools
 import os
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import Future
+from typing import TYPE_CHECKING
 
 import draccus
-import mlflow
-import mlflow.entities
-from databricks.sdk import WorkspaceClient
-from torch.utils.tensorboard.writer import SummaryWriter
 
+from katib_example.config import Config
 from katib_example.launch_katib import KatibTrialInfo
 
+if TYPE_CHECKING:
+    import mlflow.entities
+    from databricks.sdk import WorkspaceClient
 
-@dataclass
-class NestedConfig:
-    """Some nested configuration."""
 
-    hyperparameter: float
+def _create_workspace_client(future: "Future[WorkspaceClient]"):
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        from databricks.sdk import WorkspaceClient
 
+        future.set_result(WorkspaceClient())
+    except Exception as e:
+        future.set_exception(e)
 
-@dataclass
-class Config:
-    """Training Config for Machine Learning."""
 
-    nested: NestedConfig
-    tensorboard_dir: str
+@functools.cache
+def _workspace_client() -> "Future[WorkspaceClient]":
+    # Constructing the client runs Databricks authentication. Do it on a background thread so that it overlaps with the
+    # rest of the trial's startup, and share one client and its HTTP session. Errors are raised where the result is
+    # used. A failure is cached as well and not retried, which fails the trial.
+    #
+    # The thread is a daemon so that exiting early, for example on `--help` or an invalid argument, does not wait for
+    # authentication to finish.
+    future: Future[WorkspaceClient] = Future()
+    threading.Thread(target=_create_workspace_client, args=(future,), daemon=True).start()
+    return future
 
-    def __repr__(self) -> str:
-        return draccus.cfgparsing.dump(self)
 
+def _set_experiment(path: str) -> "mlflow.entities.Experiment":
+    import mlflow
 
-def _set_experiment(path: str) -> mlflow.entities.Experiment:
     # Databricks requires that we create parent directories. The MLFlow client
     # does not do this by default.
     parts = path.rsplit("/", 1)
     if len(parts) > 1:
-        WorkspaceClient().workspace.mkdirs(parts[0])
+        _workspace_client().result().workspace.mkdirs(parts[0])
     return mlflow.set_experiment(path)
 
 
 def _run_experiment_trial(cfg: Config):
+    # MLFlow is imported here rather than at module scope so that the slow import runs while the Databricks client is
+    # constructed in the background, instead of delaying the start of `_main`.
+    import mlflow
+    from mlflow.entities import Metric, Param, RunTag
+    from mlflow.tracking import MlflowClient
+
     katib = KatibTrialInfo.from_env()
     assert katib is not None
 
@@ -48,31 +66,45 @@ def _run_experiment_trial(cfg: Config):
 
     experiment = _set_experiment(f"/Shared/launch-example-katib/{katib.experiment_name}")
     with mlflow.start_run(experiment_id=experiment.experiment_id, run_name=katib.trial_name) as run:
-        mlflow.set_tags(katib.tags())
+        # Optimize something
+        hyperparameter = cfg.nested.hyperparameter
+        loss = hyperparameter * hyperparameter
+
+        # Imported lazily because torch is slow to import.
+        from torch.utils.tensorboard.summary import hparams
+        from torch.utils.tensorboard.writer import SummaryWriter
 
         with SummaryWriter(log_dir=cfg.tensorboard_dir) as writer:
-            writer.add_hparams(
+            # `SummaryWriter.add_hparams` opens a second writer with its own event file in a subdirectory. Write
+            # the hparams summaries to the main event file instead so everything ends up in a single file.
+            file_writer = writer.file_writer
+            assert file_writer is not None
+            for summary in hparams(
                 {
                     "nested__hyperparameter": cfg.nested.hyperparameter,
                 },
                 {},
-            )
-            mlflow.log_params(
-                {
-                    "nested__hyperparameter": cfg.nested.hyperparameter,
-                }
-            )
-
-            # Optimize something
-            loss = cfg.nested.hyperparameter**2
+            ):
+                file_writer.add_summary(summary)
 
             # Log the loss. The `new_style=True` argument is required for katib due
             # to https://github.com/kubeflow/katib/issues/2466
             writer.add_scalar("loss", loss, global_step=0, new_style=True)
-            mlflow.log_metrics({"loss": loss}, step=0, run_id=run.info.run_id)
+
+        # Log tags, params and metrics to MLFlow in a single request rather than one request each.
+        MlflowClient().log_batch(
+            run.info.run_id,
+            metrics=[Metric("loss", loss, int(time.time() * 1000), 0)],
+            params=[Param("nested__hyperparameter", str(cfg.nested.hyperparameter))],
+            tags=[RunTag(key, value) for key, value in katib.tags().items()],
+        )
 
 
 def _main():
+    # Start authenticating with Databricks while the command line is parsed and MLFlow is imported.
+    if os.environ.get("MLFLOW_TRACKING_URI") == "databricks":
+        _workspace_client()
+
     cfg = draccus.argparsing.parse(config_class=Config)
     print(cfg, flush=True)
 